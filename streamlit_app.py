@@ -1,10 +1,17 @@
 from __future__ import annotations
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import streamlit as st
-from quakefeeds import QuakeFeed
+
+# plotly, requests y orjson se importan dentro de las funciones que los usan.
+# Solo ahorra en el arranque en frío (y en el camino de st.stop() sin eventos):
+# dentro del mismo proceso los reruns ya los encuentran en sys.modules, y
+# st.plotly_chart / el caché de figuras cargan plotly en toda corrida con datos.
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 
 # Configuración del app
@@ -15,6 +22,16 @@ APP_TITULO = "Datos en Tiempo Real de los Terremotos en Puerto Rico y en el Mund
 # Bounding box aproximado para Puerto Rico
 PR_BBOX = {"lat_min": 17.6, "lat_max": 18.7, "lon_min": -67.8, "lon_max": -64.8}
 
+# Feeds resumen de USGS: {severidad}_{periodo}.geojson
+USGS_FEED_URL = "https://earthquake.usgs.gov/earthquakes/feed/v1.0/summary/{}_{}.geojson"
+
+# Segundos de espera máxima por respuesta de USGS
+USGS_TIMEOUT = 30
+
+# API de consultas de USGS (para pedir solo un bounding box)
+USGS_QUERY_URL = "https://earthquake.usgs.gov/fdsnws/event/1/query"
+PERIODO_DIAS = {"day": 1, "week": 7, "month": 30}
+
 # Timezone Puerto Rico (UTC-4)
 TZ_PR = ZoneInfo("America/Puerto_Rico")
 
@@ -24,16 +41,28 @@ MESES_ES = {
     7: "Julio", 8: "Agosto", 9: "Septiembre", 10: "Octubre", 11: "Noviembre", 12: "Diciembre"
 }
 
-# Colores 
-COLOR_SCALE_PROF = [
-    (0.00, "#000000"),  # negro (bajo)
-    (0.18, "#0b2cff"),  # azul
-    (0.36, "#31b6ff"),  # celeste
-    (0.55, "#fff7b2"),  # amarillo claro
-    (0.72, "#ffb347"),  # anaranjado
-    (0.88, "#ff3b2f"),  # rojo
-    (1.00, "#2b0000"),  # rojo oscuro (alto)
-]
+# Clasificación Richter: límites inferiores de cada clase a partir de "menor"
+RICHTER_BINS = np.array([2, 4, 5, 6, 7, 8, 10], dtype=np.float64)
+RICHTER_CLASES = np.array(["micro", "menor", "ligero", "moderado", "fuerte", "mayor", "épico", "legendario"])
+
+# Máximo de eventos con hover completo en el mapa del mundo
+HOVER_COMPLETO_MAX = 2000
+
+# Cantidad de barras en los histogramas
+HIST_BINS = 30
+
+# Colores por clasificación Richter (una búsqueda por punto, sin interpolar)
+COLOR_MAP = {
+    "micro": "#000000",       # negro
+    "menor": "#0b2cff",       # azul
+    "ligero": "#31b6ff",      # celeste
+    "moderado": "#fff7b2",    # amarillo claro
+    "fuerte": "#ffb347",      # anaranjado
+    "mayor": "#ff3b2f",       # rojo
+    "épico": "#2b0000",       # rojo oscuro
+    "legendario": "#2b0000",  # rojo oscuro
+    "desconocida": "#9e9e9e", # gris
+}
 
 # Estilo leve para centrar título
 st.markdown(
@@ -50,36 +79,11 @@ st.markdown(
 
 # Funciones 
 
-def clasificacion_richter(mag: float | None) -> str:
-    if mag is None or pd.isna(mag):
-        return "desconocida"
-    try:
-        m = float(mag)
-    except Exception:
-        return "desconocida"
-
-    if m < 2:
-        return "micro"
-    if 2 <= m <= 3.9:
-        return "menor"
-    if 4 <= m <= 4.9:
-        return "ligero"
-    if 5 <= m <= 5.9:
-        return "moderado"
-    if 6 <= m <= 6.9:
-        return "fuerte"
-    if 7 <= m <= 7.9:
-        return "mayor"
-    if 8 <= m <= 9.9:
-        return "épico"
-    return "legendario"
-
-
-def fecha_es_sola(dt_utc: datetime | None) -> str:
-    """Fecha del evento: '14 de Diciembre de 2025'."""
-    if dt_utc is None or pd.isna(dt_utc):
-        return ""
-    return f"{dt_utc.day} de {MESES_ES.get(dt_utc.month, dt_utc.month)} de {dt_utc.year}"
+def clasificacion_richter(mag) -> np.ndarray:
+    """Clase Richter para un arreglo de magnitudes (NaN -> "desconocida")."""
+    m = np.asarray(mag, dtype=np.float64)
+    idx = np.searchsorted(RICHTER_BINS, m, side="right")
+    return np.where(np.isnan(m), "desconocida", RICHTER_CLASES[idx])
 
 
 def fecha_peticion_es(dt_utc: datetime) -> str:
@@ -88,68 +92,134 @@ def fecha_peticion_es(dt_utc: datetime) -> str:
     return f"{dt.day} de {MESES_ES.get(dt.month, dt.month)} de {dt.year} {dt.strftime('%I:%M:%S %p')}"
 
 
-def filtrar_puerto_rico(df: pd.DataFrame) -> pd.DataFrame:
-    if df.empty:
-        return df
-    m = (
-        df["lat"].between(PR_BBOX["lat_min"], PR_BBOX["lat_max"], inclusive="both")
-        & df["lon"].between(PR_BBOX["lon_min"], PR_BBOX["lon_max"], inclusive="both")
-    )
-    return df.loc[m].reset_index(drop=True)
+def _get_geojson(url: str, params: dict | None = None) -> dict:
+    """GET a USGS y decodifica el GeoJSON con orjson (más rápido que json)."""
+    import orjson
+    import requests
+
+    response = requests.get(url, params=params, timeout=USGS_TIMEOUT)
+    if response.status_code != 200:
+        raise IOError(f"HTTP status code {response.status_code:d}")
+    return orjson.loads(response.content)
+
+
+def _fetch(severidad: str, periodo: str) -> dict:
+    """GeoJSON del feed resumen de USGS (el mismo que usa QuakeFeed)."""
+    return _get_geojson(USGS_FEED_URL.format(severidad, periodo))
+
+
+def _fetch_usgs_bbox(severidad: str, periodo: str, bbox: dict) -> dict:
+    """
+    GeoJSON de la API de consultas de USGS limitado a un bounding box.
+    Mismos filtros que los feeds resumen, pero USGS solo envía los
+    eventos dentro de bbox.
+    """
+    inicio = datetime.now(timezone.utc) - timedelta(days=PERIODO_DIAS[periodo])
+    params = {
+        "format": "geojson",
+        "starttime": inicio.strftime("%Y-%m-%dT%H:%M:%S"),
+        "minlatitude": bbox["lat_min"],
+        "maxlatitude": bbox["lat_max"],
+        "minlongitude": bbox["lon_min"],
+        "maxlongitude": bbox["lon_max"],
+    }
+    if severidad == "significant":
+        params["minsig"] = 600
+    elif severidad != "all":
+        params["minmagnitude"] = severidad
+    return _get_geojson(USGS_QUERY_URL, params)
 
 
 @st.cache_data(ttl=120, show_spinner=False)
-def generaTabla(severidad: str, periodo: str) -> pd.DataFrame:
+def generaTabla(severidad: str, periodo: str, zona: str = "Mundo") -> pd.DataFrame:
     """
-    Versión del profesor: crea DataFrame desde QuakeFeed.
+    Versión del profesor: crea DataFrame desde el feed de USGS.
     - severidad: "all", "significant", "4.5", "2.5", "1.0"
     - periodo: "month", "week", "day"
+    - zona: con "Puerto Rico" se piden a USGS solo los eventos del bbox de PR
     """
-    feed = QuakeFeed(severidad, periodo)
-
-    # De QuakeFeed: location(i) -> (lon, lat)
-    longitudes = [feed.location(i)[0] for i in range(len(feed))]
-    latitudes = [feed.location(i)[1] for i in range(len(feed))]
-
-    # Propiedades del feed
-    # event_times suele venir como lista de datetimes
-    event_times = list(feed.event_times)
-    depths = list(feed.depths)
-    places = list(feed.places)
-    magnitudes = list(feed.magnitudes)
-
-    df = pd.DataFrame([event_times, longitudes, latitudes, places, magnitudes, depths]).transpose()
-    df.columns = ["time", "lon", "lat", "localización", "magnitud", "profundidad"]
-
-    # Tipos numéricos
-    df["lat"] = pd.to_numeric(df["lat"], errors="coerce")
-    df["lon"] = pd.to_numeric(df["lon"], errors="coerce")
-    df["magnitud"] = pd.to_numeric(df["magnitud"], errors="coerce")
-    df["profundidad"] = pd.to_numeric(df["profundidad"], errors="coerce")
+    if zona == "Puerto Rico":
+        features = _fetch_usgs_bbox(severidad, periodo, PR_BBOX)["features"]
+    else:
+        features = _fetch(severidad, periodo)["features"]
+
+    # Una sola pasada por los eventos, llenando un arreglo tipado por columna
+    n = len(features)
+    lons = np.empty(n, dtype=np.float64)
+    lats = np.empty(n, dtype=np.float64)
+    depths = np.empty(n, dtype=np.float64)
+    mags = np.empty(n, dtype=np.float64)
+    times_ms = np.empty(n, dtype=np.int64)
+    places = np.empty(n, dtype=object)
+    for i, feat in enumerate(features):
+        # GeoJSON: coordinates -> [lon, lat, profundidad]
+        lon, lat, depth = feat["geometry"]["coordinates"][:3]
+        props = feat["properties"]
+        lons[i] = lon
+        lats[i] = lat
+        depths[i] = np.nan if depth is None else depth
+        mags[i] = np.nan if props["mag"] is None else props["mag"]
+        times_ms[i] = props["time"]
+        places[i] = props["place"]
+
+    # time viene en milisegundos desde epoch (UTC)
+    times = pd.Series(pd.to_datetime(times_ms, unit="ms", utc=True))
+
     # Plotly NO acepta tamaños negativos/NaN en scatter_mapbox
-    df["magnitud_size"] = df["magnitud"].clip(lower=0).fillna(0)
+    sizes = np.nan_to_num(np.clip(mags, 0, None), nan=0.0)
     # Evitar que todos queden invisibles si hay muchos 0
-    if (df["magnitud_size"] == 0).all():
-        df["magnitud_size"] = 0.1
-
-    # Normalizar time a UTC si es posible
-    def _to_utc(x):
-        if isinstance(x, datetime):
-            if x.tzinfo is None:
-                return x.replace(tzinfo=timezone.utc)
-            return x.astimezone(timezone.utc)
-        return pd.NaT
-
-    df["time_utc"] = df["time"].apply(_to_utc)
-    df["fecha"] = df["time_utc"].apply(fecha_es_sola)
-    df["clasificación"] = df["magnitud"].apply(clasificacion_richter)
-
-    # Ordenar por más reciente
-    df = df.sort_values("time_utc", ascending=False, na_position="last").reset_index(drop=True)
+    if (sizes == 0).all():
+        sizes[:] = 0.1
+
+    # Fecha en español: '14 de Diciembre de 2025'
+    fecha = (
+        times.dt.day.astype(str)
+        + " de "
+        + times.dt.month.map(MESES_ES)
+        + " de "
+        + times.dt.year.astype(str)
+    )
+
+    # Columnas ya con su dtype final: float32 y categorías (la mitad de
+    # memoria y de JSON enviado a Plotly) sin copias ni conversiones después
+    df = pd.DataFrame(
+        {
+            "time_utc": times,
+            "lon": lons.astype(np.float32),
+            "lat": lats.astype(np.float32),
+            "localización": pd.Categorical(places),
+            "magnitud": mags.astype(np.float32),
+            "profundidad": depths.astype(np.float32),
+            "magnitud_size": sizes.astype(np.float32),
+            "fecha": fecha,
+            "clasificación": pd.Categorical(clasificacion_richter(mags)),
+        }
+    )
+
+    # Sin ordenar: el feed de USGS ya viene del más reciente al más antiguo
     return df
 
 
-def generaMapa(df: pd.DataFrame, zona: str, rango_fijo: bool) -> "px.Figure":
+def agrupar_colocados(df: pd.DataFrame, decimales: int = 2) -> pd.DataFrame:
+    """
+    Un marcador por celda de 10**-decimales grados (réplicas en el mismo
+    epicentro): se queda el evento de mayor magnitud y la columna `eventos`
+    cuenta cuántos había en la celda.
+    """
+    celdas = ["lat_celda", "lon_celda"]
+    df = df.assign(lat_celda=df["lat"].round(decimales), lon_celda=df["lon"].round(decimales))
+    df["eventos"] = df.groupby(celdas)["lat"].transform("size")
+    df = df.sort_values("magnitud", ascending=False, na_position="last")
+    return df.drop_duplicates(subset=celdas).drop(columns=celdas).reset_index(drop=True)
+
+
+def _mapa_base(zona: str, hover_completo: bool) -> go.Figure:
+    """
+    Figura del mapa sin datos: layout, leyenda de colores y hover.
+    Un solo trace Scattermapbox de eventos; en "Mundo" con clustering de mapbox-gl.
+    """
+    import plotly.graph_objects as go
+
     # Centro/zoom
     if zona == "Puerto Rico":
         center = dict(lat=18.25178, lon=-66.254512)
@@ -158,85 +228,146 @@ def generaMapa(df: pd.DataFrame, zona: str, rango_fijo: bool) -> "px.Figure":
         center = dict(lat=10, lon=0)
         zoom = 1.0
 
-    fig = px.scatter_mapbox(
-        df,
-        lat="lat",
-        lon="lon",
-        color="magnitud_color",
-        size="magnitud_size",
-        hover_name="localización",
-        hover_data={
-           
-            "magnitud": True,
-            "lat": True,
-            "lon": True,
-            "fecha": True,
-            "profundidad": True,
-            
-            "magnitud_color": False,
-            "magnitud_size": False,
-        },
-        color_continuous_scale=COLOR_SCALE_PROF,
-        size_max=8,
-        opacity=0.65,
-        center=center,
-        zoom=zoom,
+    # Hover completo solo con pocos eventos; si no, magnitud + lugar
+    if hover_completo:
+        hovertemplate = (
+            "<b>%{customdata[0]}</b><br><br>"
+            "magnitud=%{customdata[1]:.2f}<br>"
+            "lat=%{lat:.4f}<br>"
+            "lon=%{lon:.4f}<br>"
+            "fecha=%{customdata[2]}<br>"
+            "profundidad=%{customdata[3]:.2f}"
+        )
+        # En PR cada marcador agrupa los eventos de la misma celda de 0.01°
+        if zona == "Puerto Rico":
+            hovertemplate += "<br>eventos=%{customdata[4]}"
+        hovertemplate += "<extra></extra>"
+    else:
+        hovertemplate = "<b>%{customdata[0]}</b><br><br>magnitud=%{customdata[1]:.2f}<extra></extra>"
+
+    fig = go.Figure(
+        go.Scattermapbox(
+            name="eventos",
+            mode="markers",
+            marker=dict(sizemode="area"),
+            opacity=0.65,
+            # Supercluster de mapbox-gl hasta zoom 8; color/tamaño por niveles:
+            # <50, 50-499 y 500+ eventos (step da los umbrales entre niveles)
+            cluster=dict(
+                enabled=zona == "Mundo",
+                maxzoom=8,
+                step=[50, 500],
+                color=["#31b6ff", "#ffb347", "#ff3b2f"],
+                size=[12, 18, 26],
+            ),
+            hovertemplate=hovertemplate,
+            showlegend=False,
+        )
+    )
+    # Leyenda: un trace vacío por clase, solo para mostrar el color
+    for clase, color in COLOR_MAP.items():
+        fig.add_trace(
+            go.Scattermapbox(
+                name=clase,
+                lat=[None],
+                lon=[None],
+                mode="markers",
+                marker=dict(color=color, size=10),
+                hoverinfo="skip",
+            )
+        )
+    fig.update_layout(
+        mapbox=dict(center=center, zoom=zoom),
         height=520,
+        legend=dict(title_text="clasificación", x=0.01, y=0.99, bgcolor="rgba(255,255,255,0.7)"),
     )
 
     fig.update_layout(mapbox_style="carto-darkmatter", margin={"r": 0, "t": 30, "l": 0, "b": 0})
-
-   
-    ticks = [1.8, 2.0, 2.2, 2.4, 2.6, 2.8, 3.0]
-    if rango_fijo:
-        fig.update_coloraxes(
-            cmin=1.8,
-            cmax=3.0,
-            colorbar_title="magnitud",
-            colorbar=dict(tickvals=ticks),
-        )
-    else:
-        fig.update_coloraxes(colorbar_title="magnitud")
+    # Hover solo al punto más cercano y sin spikes: menos trabajo por frame en el navegador
+    fig.update_layout(hovermode="closest", spikedistance=0, hoverdistance=10)
 
     return fig
 
 
-def generaHistogrammag(df: pd.DataFrame) -> "px.Figure":
-    """Histograma de magnitudes con escala/estilo como el ejemplo del profesor."""
-    
-    x = df["magnitud"].clip(lower=0)
-    fig = px.histogram(
-        x,
-        x="magnitud",
-        color_discrete_sequence=["red"],
-        width=350,
-        height=600,
-        template="plotly_white",
+def generaMapa(df: pd.DataFrame, zona: str) -> go.Figure:
+    """
+    La figura base se arma una vez por sesión (st.session_state) y en cada
+    rerun solo se actualizan los datos del trace con update_traces.
+    """
+    hover_completo = zona == "Puerto Rico" or len(df) <= HOVER_COMPLETO_MAX
+    key = (zona, hover_completo)
+    mapas = st.session_state.setdefault("mapas", {})
+    if key not in mapas:
+        mapas[key] = _mapa_base(zona, hover_completo)
+    fig = mapas[key]
+
+    if zona == "Puerto Rico":
+        df = agrupar_colocados(df)
+        hover_cols = ["localización", "magnitud", "fecha", "profundidad", "eventos"]
+    elif hover_completo:
+        hover_cols = ["localización", "magnitud", "fecha", "profundidad"]
+    else:
+        hover_cols = ["localización", "magnitud"]
+
+    # customdata es un arreglo object: los float32 saldrían como dobles largos
+    # (7.489999771118164); se redondean en float64 para que viajen como 7.49
+    hover = df[hover_cols].copy()
+    for col in ("magnitud", "profundidad"):
+        if col in hover:
+            hover[col] = hover[col].astype(np.float64).round(2)
+
+    size_max = 8
+    sizes = df["magnitud_size"].to_numpy()
+    fig.update_traces(
+        lat=df["lat"],
+        lon=df["lon"],
+        customdata=hover.to_numpy(),
+        marker=dict(
+            color=df["clasificación"].map(COLOR_MAP).to_numpy(),
+            size=sizes,
+            # Mismo escalado que px con size_max=8
+            sizeref=2.0 * float(sizes.max(initial=0.1)) / size_max**2,
+        ),
+        selector=dict(name="eventos"),
     )
-    fig.update_layout(title_text="", title_x=0.5, margin={"l": 60, "r": 10, "t": 20, "b": 50})
-    fig.update_xaxes(title_text="magnitud")
-    fig.update_yaxes(title_text="count")
     return fig
 
 
-def generaHistogramprof(df: pd.DataFrame) -> "px.Figure":
-    """Histograma de profundidades con escala/estilo como el ejemplo del profesor."""
-    x = df["profundidad"].clip(lower=0)
-    fig = px.histogram(
-        x,
-        x="profundidad",
-        color_discrete_sequence=["red"],
+@st.cache_data(ttl=120, show_spinner=False)
+def generaHistograma(df: pd.DataFrame, columna: str) -> go.Figure:
+    """Histograma de `columna` con escala/estilo como el ejemplo del profesor."""
+    import plotly.graph_objects as go
+
+    # Pre-binning en el servidor: se envían HIST_BINS barras, no N valores
+    x = df[columna].clip(lower=0).dropna().to_numpy()
+    counts, edges = np.histogram(x, bins=HIST_BINS)
+    # Bordes en float64: con columnas float32 el hover mostraría 1.1366668
+    edges = edges.astype(np.float64)
+    fig = go.Figure(
+        go.Bar(
+            x=0.5 * (edges[:-1] + edges[1:]),
+            y=counts,
+            width=np.diff(edges),
+            marker_color="red",
+            # Rango de la barra, como px.histogram: 'magnitud=1.10-1.20'
+            customdata=np.column_stack([edges[:-1], edges[1:]]),
+            hovertemplate=columna + "=%{customdata[0]:.2f}-%{customdata[1]:.2f}<br>count=%{y}<extra></extra>",
+        )
+    )
+    fig.update_layout(
         width=350,
         height=600,
         template="plotly_white",
+        bargap=0,
+        title_text="",
+        title_x=0.5,
+        margin={"l": 60, "r": 10, "t": 20, "b": 50},
     )
-    fig.update_layout(title_text="", title_x=0.5, margin={"l": 60, "r": 10, "t": 20, "b": 50})
-    fig.update_xaxes(title_text="profundidad")
+    fig.update_xaxes(title_text=columna)
     fig.update_yaxes(title_text="count")
     return fig
 
 
-
 # Sidebar 
 st.sidebar.markdown('<div class="side-label">Severidad</div>', unsafe_allow_html=True)
 sev_label = st.sidebar.selectbox(
@@ -284,7 +415,7 @@ Universidad de Puerto Rico en Humacao
     unsafe_allow_html=True,
 )
 
-# Mapeo a quakefeeds
+# Mapeo a los feeds de USGS
 sev_map = {"todos": "all", "significativo": "significant", "4.5": "4.5", "2.5": "2.5", "1.0": "1.0"}
 periodo_map = {"mes": "month", "semana": "week", "día": "day"}
 
@@ -298,24 +429,18 @@ periodo_feed = periodo_map[periodo_label]
 st.title(APP_TITULO)
 
 with st.spinner("Cargando datos de terremotos (USGS)..."):
-    df = generaTabla(severidad_feed, periodo_feed)
-
-# Filtro por zona
-if zona == "Puerto Rico":
-    df = filtrar_puerto_rico(df)
-
-# Ajuste del rango/colores 
-df["magnitud_color"] = df["magnitud"]
-rango_fijo = False
-if zona == "Puerto Rico" and sev_label == "todos" and periodo_label == "mes":
-    rango_fijo = True
-    df["magnitud_color"] = df["magnitud"].clip(lower=1.8, upper=3.0)
+    # Con zona "Puerto Rico" USGS ya devuelve solo los eventos del bbox de PR
+    df = generaTabla(severidad_feed, periodo_feed, zona)
 
 # Métricas
 fecha_peticion = datetime.now(timezone.utc)
-cantidad = int(len(df))
-prom_mag = float(df["magnitud"].mean()) if cantidad > 0 else float("nan")
-prom_prof = float(df["profundidad"].mean()) if cantidad > 0 else float("nan")
+cantidad = len(df)
+# Ambos promedios en una sola pasada sobre un bloque float contiguo
+if cantidad > 0:
+    arr = df[["magnitud", "profundidad"]].to_numpy(dtype=np.float64)
+    prom_mag, prom_prof = (float(v) for v in np.nanmean(arr, axis=0))
+else:
+    prom_mag = prom_prof = float("nan")
 prom_mag_str = f"{prom_mag:.2f}" if cantidad > 0 else "N/A"
 prom_prof_str = f"{prom_prof:.2f} km" if cantidad > 0 else "N/A"
 
@@ -337,8 +462,7 @@ if df.empty:
 
 # TABLA arriba 
 if mostrar_tabla:
-    df_tabla = df[["fecha", "localización", "magnitud", "clasificación"]].copy()
-    df_tabla = df_tabla.sort_values("magnitud", ascending=False, na_position="last").head(n_eventos_tabla)
+    df_tabla = df[["fecha", "localización", "magnitud", "clasificación"]].nlargest(n_eventos_tabla, "magnitud")
     df_tabla = df_tabla.reset_index(drop=True)
     df_tabla.index = range(1, len(df_tabla) + 1)
     st.dataframe(df_tabla, use_container_width=True)
@@ -348,16 +472,16 @@ c1, c2, c3 = st.columns([1.2, 1.2, 2])
 
 with c1:
     st.markdown("#### Histograma de Magnitudes")
-    st.plotly_chart(generaHistogrammag(df), use_container_width=False)
+    st.plotly_chart(generaHistograma(df, "magnitud"), use_container_width=False)
 
 with c2:
     st.markdown("#### Histograma de Profundidades")
-    st.plotly_chart(generaHistogramprof(df), use_container_width=False)
+    st.plotly_chart(generaHistograma(df, "profundidad"), use_container_width=False)
 
 with c3:
     if mostrar_mapa:
         st.markdown("<br>", unsafe_allow_html=True)
-        st.plotly_chart(generaMapa(df, zona, rango_fijo), use_container_width=True)
+        st.plotly_chart(generaMapa(df, zona), use_container_width=True)
     else:
         st.info("Activa “Mostrar mapa” en la barra izquierda para ver el mapa.")
 